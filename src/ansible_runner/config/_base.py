@@ -30,6 +30,7 @@ import tempfile
 import shutil
 from base64 import b64encode
 from enum import Enum
+from types import MappingProxyType
 from uuid import uuid4
 from collections.abc import Mapping
 from typing import Any
@@ -52,6 +53,22 @@ from ansible_runner.utils import (
 
 logger = logging.getLogger('ansible-runner')
 
+# ansible CLI options whose values are paths that need bind mounting
+_INVENTORY_FILE_OPTIONS = frozenset(('-i', '--inventory', '--inventory-file'))
+_VAULT_FILE_OPTIONS = frozenset(('--vault-password-file', '--vault-pass-file'))
+_PRIVATE_KEY_FILE_OPTIONS = frozenset(('--private-key', '--key-file'))
+_OPTIONAL_MOUNT_OPTIONS = _INVENTORY_FILE_OPTIONS | _VAULT_FILE_OPTIONS | _PRIVATE_KEY_FILE_OPTIONS
+_HELP_OPTIONS = frozenset(('-h', '--help'))
+
+# host directories that must never be bind mounted into a container
+_UNSAFE_MOUNT_PATHS = frozenset(('/', '/home', '/usr'))
+
+# environment every job gets regardless of its settings, applied in one update()
+_STATIC_ENV = MappingProxyType({
+    'ANSIBLE_STDOUT_CALLBACK': 'awx_display',
+    'ANSIBLE_RETRY_FILES_ENABLED': 'False',
+})
+
 
 class BaseExecutionMode(Enum):
     NONE = 0
@@ -73,6 +90,7 @@ class BaseConfig:
                  artifact_dir: str | None = None,
                  fact_cache_type: str = 'jsonfile',
                  fact_cache=None,
+                 fact_cache_shared: bool = False,
                  process_isolation: bool = False,
                  process_isolation_executable: str | None = None,
                  container_image: str = "",
@@ -150,7 +168,8 @@ class BaseConfig:
 
         self.rotate_artifacts = rotate_artifacts
         self.fact_cache_type = fact_cache_type
-        self.fact_cache = os.path.join(self.artifact_dir, fact_cache or 'fact_cache') if self.fact_cache_type == 'jsonfile' else None
+        self.fact_cache_shared = fact_cache_shared
+        self.fact_cache = self._fact_cache_path(fact_cache or 'fact_cache') if self.fact_cache_type == 'jsonfile' else None
 
         self.loader = ArtifactLoader(self.private_data_dir)
 
@@ -250,7 +269,8 @@ class BaseConfig:
             artifact_dir = os.path.join("/runner/artifacts", self.ident)
             self.env['AWX_ISOLATED_DATA_DIR'] = artifact_dir
             if self.fact_cache_type == 'jsonfile':
-                self.env['ANSIBLE_CACHE_PLUGIN_CONNECTION'] = os.path.join(artifact_dir, 'fact_cache')
+                fact_cache_dir = "/runner" if self.fact_cache_shared else artifact_dir
+                self.env['ANSIBLE_CACHE_PLUGIN_CONNECTION'] = os.path.join(fact_cache_dir, 'fact_cache')
 
         else:
             # seed env with existing shell env
@@ -285,9 +305,9 @@ class BaseConfig:
         if 'fact_cache' in self.settings:
             if 'fact_cache_type' in self.settings:
                 if self.settings['fact_cache_type'] == 'jsonfile':
-                    self.fact_cache = os.path.join(self.artifact_dir, self.settings['fact_cache'])
+                    self.fact_cache = self._fact_cache_path(self.settings['fact_cache'])
             else:
-                self.fact_cache = os.path.join(self.artifact_dir, self.settings['fact_cache'])
+                self.fact_cache = self._fact_cache_path(self.settings['fact_cache'])
 
         # Use local callback directory
         if self.containerized:
@@ -299,19 +319,20 @@ class BaseConfig:
                 shutil.rmtree(callback_dir)
             shutil.copytree(get_callback_dir(), callback_dir)
 
-            container_callback_dir = os.path.join("/runner/artifacts", self.ident, "callback")
-            self.env['ANSIBLE_CALLBACK_PLUGINS'] = ':'.join(filter(None, (self.env.get('ANSIBLE_CALLBACK_PLUGINS'), container_callback_dir)))
+            callback_plugin_dir = os.path.join("/runner/artifacts", self.ident, "callback")
         else:
-            callback_dir = self.env.get('AWX_LIB_DIRECTORY', os.getenv('AWX_LIB_DIRECTORY', ''))
-            if not callback_dir:
-                callback_dir = get_callback_dir()
-            self.env['ANSIBLE_CALLBACK_PLUGINS'] = ':'.join(filter(None, (self.env.get('ANSIBLE_CALLBACK_PLUGINS'), callback_dir)))
+            # self.env was seeded from os.environ above, so it already covers the process environment
+            callback_plugin_dir = self.env.get('AWX_LIB_DIRECTORY') or get_callback_dir()
+
+        callback_plugins = self.env.get('ANSIBLE_CALLBACK_PLUGINS')
+        self.env['ANSIBLE_CALLBACK_PLUGINS'] = f"{callback_plugins}:{callback_plugin_dir}" if callback_plugins else callback_plugin_dir
 
         # this is an adhoc command if the module is specified, TODO: combine with logic in RunnerConfig class
         is_adhoc = bool((getattr(self, 'binary', None) is None) and (getattr(self, 'module', None) is not None))
 
-        if self.env.get('ANSIBLE_STDOUT_CALLBACK'):
-            self.env['ORIGINAL_STDOUT_CALLBACK'] = self.env.get('ANSIBLE_STDOUT_CALLBACK')
+        original_stdout_callback = self.env.get('ANSIBLE_STDOUT_CALLBACK')
+        if original_stdout_callback:
+            self.env['ORIGINAL_STDOUT_CALLBACK'] = original_stdout_callback
 
         if is_adhoc:
             # force loading awx_display stdout callback for adhoc commands
@@ -319,11 +340,8 @@ class BaseConfig:
             if 'AD_HOC_COMMAND_ID' not in self.env:
                 self.env['AD_HOC_COMMAND_ID'] = '1'
 
-        self.env['ANSIBLE_STDOUT_CALLBACK'] = 'awx_display'
-
-        self.env['ANSIBLE_RETRY_FILES_ENABLED'] = 'False'
-        if 'ANSIBLE_HOST_KEY_CHECKING' not in self.env:
-            self.env['ANSIBLE_HOST_KEY_CHECKING'] = 'False'
+        self.env.update(_STATIC_ENV)
+        self.env.setdefault('ANSIBLE_HOST_KEY_CHECKING', 'False')
         if not self.containerized:
             self.env['AWX_ISOLATED_DATA_DIR'] = self.artifact_dir
 
@@ -332,8 +350,13 @@ class BaseConfig:
             if not self.containerized:
                 self.env['ANSIBLE_CACHE_PLUGIN_CONNECTION'] = self.fact_cache
 
-        # Pexpect will error with non-string envvars types, so we ensure string types
-        self.env = {str(k): str(v) for k, v in self.env.items()}
+        # Pexpect will error with non-string envvars types, so we ensure string types.
+        # Only the offending entries are converted; the inherited process environment
+        # is already all strings and need not be copied a second time.
+        non_str_items = [(k, v) for k, v in self.env.items() if not (isinstance(k, str) and isinstance(v, str))]
+        for k, v in non_str_items:
+            del self.env[k]
+            self.env[str(k)] = str(v)
 
         debug('env:')
         for k, v in sorted(self.env.items()):
@@ -353,39 +376,57 @@ class BaseConfig:
         if hasattr(self, 'command') and isinstance(self.command, list):
             logger.debug("command: %s", ' '.join(self.command))
 
+    def _fact_cache_path(self, name: str) -> str:
+        # a shared cache lives in private_data_dir itself, outside the artifacts directory
+        # that rotate_artifacts prunes, so it survives between runs
+        base_dir = self.private_data_dir if self.fact_cache_shared else self.artifact_dir
+        return os.path.join(base_dir, name)
+
     def _ensure_path_safe_to_mount(self, path: str) -> None:
         if os.path.isfile(path):
             path = os.path.dirname(path)
-        if os.path.join(path, "") in ('/', '/home/', '/usr/'):
+        self._ensure_dir_safe_to_mount(path)
+
+    @staticmethod
+    def _ensure_dir_safe_to_mount(path: str) -> None:
+        if os.path.normpath(path) in _UNSAFE_MOUNT_PATHS:
             raise ConfigurationError("When using containerized execution, cannot mount '/' or '/home' or '/usr'")
 
     def _get_playbook_path(self, cmdline_args: list[str]) -> str | None:
         _playbook = ""
-        _book_keeping_copy = cmdline_args.copy()
+        # drop the inventory options along with their values in a single pass
+        _book_keeping_copy = []
+        skip_value = False
         for arg in cmdline_args:
-            if arg in ['-i', '--inventory', '--inventory-file']:
-                _book_keeping_copy_inventory_index = _book_keeping_copy.index(arg)
-                _book_keeping_copy.pop(_book_keeping_copy_inventory_index)
-                try:
-                    _book_keeping_copy.pop(_book_keeping_copy_inventory_index)
-                except IndexError:
-                    # invalid command, pass through for execution
-                    # to return correct error from ansible-core
-                    return None
+            if skip_value:
+                skip_value = False
+            elif arg in _INVENTORY_FILE_OPTIONS:
+                skip_value = True
+            else:
+                _book_keeping_copy.append(arg)
+
+        if skip_value:
+            # invalid command, pass through for execution
+            # to return correct error from ansible-core
+            return None
+
+        if not _book_keeping_copy:
+            return _playbook
 
         if len(_book_keeping_copy) == 1:
             # it's probably safe to assume this is the playbook
             _playbook = _book_keeping_copy[0]
-        elif _book_keeping_copy[0][0] != '-':
+        elif not _book_keeping_copy[0].startswith('-'):
             # this should be the playbook, it's the only "naked" arg
             _playbook = _book_keeping_copy[0]
         else:
             # parse everything beyond the first arg because we checked that
             # in the previous case already
-            for arg in _book_keeping_copy[1:]:
-                if arg[0] == '-':
+            for index in range(1, len(_book_keeping_copy)):
+                arg = _book_keeping_copy[index]
+                if arg.startswith('-'):
                     continue
-                if _book_keeping_copy[(_book_keeping_copy.index(arg) - 1)][0] != '-':
+                if not _book_keeping_copy[index - 1].startswith('-'):
                     _playbook = arg
                     break
 
@@ -408,28 +449,27 @@ class BaseConfig:
         # set dest src (if None) relative to workdir(not absolute) or provided
         if dst_mount_path is None:
             dst_path = src_path
-        elif self.container_workdir and not os.path.isabs(dst_mount_path):
-            dst_path = os.path.abspath(
-                os.path.expanduser(
-                    os.path.expandvars(os.path.join(self.container_workdir, dst_mount_path))
-                )
-            )
         else:
+            if self.container_workdir and not os.path.isabs(dst_mount_path):
+                dst_mount_path = os.path.join(self.container_workdir, dst_mount_path)
             dst_path = os.path.abspath(os.path.expanduser(os.path.expandvars(dst_mount_path)))
 
         # ensure each is a directory not file, use src for dest
         # because dest doesn't exist locally
-        src_dir = src_path if os.path.isdir(src_path) else os.path.dirname(src_path)
-        dst_dir = dst_path if os.path.isdir(src_path) else os.path.dirname(dst_path)
+        if os.path.isdir(src_path):
+            src_dir, dst_dir = src_path, dst_path
+        else:
+            src_dir, dst_dir = os.path.dirname(src_path), os.path.dirname(dst_path)
 
         # always ensure a trailing slash
         src_dir = os.path.join(src_dir, "")
         dst_dir = os.path.join(dst_dir, "")
 
         # ensure the src and dest are safe mount points
-        # after stripping off the file and resolving
-        self._ensure_path_safe_to_mount(src_dir)
-        self._ensure_path_safe_to_mount(dst_dir)
+        # after stripping off the file and resolving; both are
+        # directories by now so no further isfile() probe is needed
+        self._ensure_dir_safe_to_mount(src_dir)
+        self._ensure_dir_safe_to_mount(dst_dir)
 
         # format the src dest str
         volume_mount_path = f"{src_dir}:{dst_dir}"
@@ -445,16 +485,10 @@ class BaseConfig:
             args_list.extend(["-v", volume_mount_path])
 
     def _handle_ansible_cmd_options_bind_mounts(self, args_list: list[str], cmdline_args: list[str]) -> None:
-        inventory_file_options = ['-i', '--inventory', '--inventory-file']
-        vault_file_options = ['--vault-password-file', '--vault-pass-file']
-        private_key_file_options = ['--private-key', '--key-file']
-
-        optional_mount_args = inventory_file_options + vault_file_options + private_key_file_options
-
         if not cmdline_args:
             return
 
-        if '-h' in cmdline_args or '--help' in cmdline_args:
+        if not _HELP_OPTIONS.isdisjoint(cmdline_args):
             return
 
         for value in self.command:
@@ -464,24 +498,24 @@ class BaseConfig:
                     self._update_volume_mount_paths(args_list, playbook_file_path)
                     break
 
-        cmdline_args_copy = cmdline_args.copy()
-        optional_arg_paths = []
-        for arg in cmdline_args:
-
-            if arg not in optional_mount_args:
+        index = 0
+        num_args = len(cmdline_args)
+        while index < num_args:
+            arg = cmdline_args[index]
+            if arg not in _OPTIONAL_MOUNT_OPTIONS:
+                index += 1
                 continue
 
-            optional_arg_index = cmdline_args_copy.index(arg)
-            optional_arg_paths.append(cmdline_args[optional_arg_index + 1])
-            cmdline_args_copy.pop(optional_arg_index)
-            try:
-                optional_arg_value = cmdline_args_copy.pop(optional_arg_index)
-            except IndexError:
+            if index + 1 >= num_args:
                 # invalid command, pass through for execution
                 # to return valid error from ansible-core
                 return
 
-            if arg in inventory_file_options and optional_arg_value.endswith(','):
+            optional_arg_value = cmdline_args[index + 1]
+            # skip over the option value as well
+            index += 2
+
+            if arg in _INVENTORY_FILE_OPTIONS and optional_arg_value.endswith(','):
                 # comma separated host list provided as value
                 continue
 
@@ -492,11 +526,12 @@ class BaseConfig:
                                        execution_mode: BaseExecutionMode,
                                        cmdline_args: list[str]
                                        ) -> list[str]:
+        is_podman = 'podman' in self.process_isolation_executable
         new_args = [self.process_isolation_executable]
         new_args.extend(['run', '--rm'])
 
         if self.runner_mode == 'pexpect' or getattr(self, 'input_fd', False):
-            new_args.extend(['--tty'])
+            new_args.append('--tty')
 
         new_args.append('--interactive')
 
@@ -523,17 +558,18 @@ class BaseConfig:
             # Handle automounts for .ssh config
             self._handle_automounts(new_args)
 
-            if 'podman' in self.process_isolation_executable:
+            if is_podman:
                 # container namespace stuff
-                new_args.extend(["--group-add=root"])
-                new_args.extend(["--ipc=host"])
+                new_args.append("--group-add=root")
+                new_args.append("--ipc=host")
 
             self._ensure_path_safe_to_mount(self.private_data_dir)
             # Relative paths are mounted relative to /runner/project
             for subdir in ('project', 'artifacts'):
-                subdir_path = os.path.join(self.private_data_dir, subdir)
-                if not os.path.exists(subdir_path):
-                    os.mkdir(subdir_path, 0o700)
+                try:
+                    os.mkdir(os.path.join(self.private_data_dir, subdir), 0o700)
+                except FileExistsError:
+                    pass
 
             # runtime commands need artifacts mounted to output data
             self._update_volume_mount_paths(new_args,
@@ -542,9 +578,10 @@ class BaseConfig:
                                             labels=":Z")
 
         else:
-            subdir_path = os.path.join(self.private_data_dir, 'artifacts')
-            if not os.path.exists(subdir_path):
-                os.mkdir(subdir_path, 0o700)
+            try:
+                os.mkdir(os.path.join(self.private_data_dir, 'artifacts'), 0o700)
+            except FileExistsError:
+                pass
 
         # Mount the entire private_data_dir
         # custom show paths inside private_data_dir do not make sense
@@ -553,8 +590,8 @@ class BaseConfig:
         if self.container_auth_data:
             # Pull in the necessary registry auth info, if there is a container cred
             self.registry_auth_path, registry_auth_conf_file = self._generate_container_auth_dir(self.container_auth_data)
-            if 'podman' in self.process_isolation_executable:
-                new_args.extend([f"--authfile={self.registry_auth_path}"])
+            if is_podman:
+                new_args.append(f"--authfile={self.registry_auth_path}")
             else:
                 docker_idx = new_args.index(self.process_isolation_executable)
                 new_args.insert(docker_idx + 1, f"--config={self.registry_auth_path}")
@@ -566,31 +603,32 @@ class BaseConfig:
 
         if self.container_volume_mounts:
             for mapping in self.container_volume_mounts:
-                volume_mounts = mapping.split(':', 2)
-                self._ensure_path_safe_to_mount(volume_mounts[0])
-                labels = None
-                if len(volume_mounts) == 3:
-                    labels = f":{volume_mounts[2]}"
-                self._update_volume_mount_paths(new_args, volume_mounts[0], dst_mount_path=volume_mounts[1], labels=labels)
+                src_mount_path, sep, dst_mount_path = mapping.partition(':')
+                if not sep:
+                    raise ConfigurationError(f"Invalid container volume mount '{mapping}', expected 'src:dest[:labels]'")
+                dst_mount_path, _, labels = dst_mount_path.partition(':')
+                self._ensure_path_safe_to_mount(src_mount_path)
+                self._update_volume_mount_paths(new_args, src_mount_path, dst_mount_path=dst_mount_path,
+                                                labels=f":{labels}" if labels else None)
 
         # Reference the file with list of keys to pass into container
         # this file will be written in ansible_runner.runner
         env_file_host = os.path.join(self.artifact_dir, 'env.list')
         new_args.extend(['--env-file', env_file_host])
 
-        if 'podman' in self.process_isolation_executable:
+        if is_podman:
             # docker doesnt support this option
-            new_args.extend(['--quiet'])
+            new_args.append('--quiet')
 
         if 'docker' in self.process_isolation_executable:
-            new_args.extend([f'--user={os.getuid()}'])
+            new_args.append(f'--user={os.getuid()}')
 
         new_args.extend(['--name', self.container_name])
 
         if self.container_options:
             new_args.extend(self.container_options)
 
-        new_args.extend([self.container_image])
+        new_args.append(self.container_image)
         new_args.extend(args)
         logger.debug("container engine invocation: %s", ' '.join(new_args))
         return new_args
@@ -665,20 +703,21 @@ class BaseConfig:
         return args
 
     def _handle_automounts(self, new_args: list[str]) -> None:
+        home = os.environ['HOME']
         for cli_automount in cli_mounts():
             for env in cli_automount['ENVS']:
-                if env in os.environ:
-                    dest_path = os.environ[env]
-
-                    if os.path.exists(os.environ[env]):
-                        if os.environ[env].startswith(os.environ['HOME']):
-                            dest_path = f"/home/runner/{os.environ[env].lstrip(os.environ['HOME'])}"
-                        elif os.environ[env].startswith('~'):
-                            dest_path = f"/home/runner/{os.environ[env].lstrip('~/')}"
-                        else:
-                            dest_path = os.environ[env]
-
-                        self._update_volume_mount_paths(new_args, os.environ[env], dst_mount_path=dest_path)
+                env_path = os.environ.get(env)
+                if env_path is not None:
+                    dest_path = env_path
+
+                    if os.path.exists(env_path):
+                        # strip the home prefix itself; str.lstrip() would treat it as a set of characters
+                        if env_path.startswith(home):
+                            dest_path = f"/home/runner/{env_path.removeprefix(home).lstrip('/')}"
+                        elif env_path.startswith('~'):
+                            dest_path = f"/home/runner/{env_path.removeprefix('~').lstrip('/')}"
+
+                        self._update_volume_mount_paths(new_args, env_path, dst_mount_path=dest_path)
 
                     new_args.extend(["-e", f"{env}={dest_path}"])
 
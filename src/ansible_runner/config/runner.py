@@ -22,8 +22,8 @@
 import json
 import logging
 import os
+import re
 import shlex
-import stat
 import tempfile
 import shutil
 
@@ -36,6 +36,51 @@ from ansible_runner.utils import register_for_cleanup
 
 logger = logging.getLogger('ansible-runner')
 
+# Characters that need the full shlex state machine to be split correctly
+_SHLEX_SPECIAL_CHARS = frozenset('\'"\\')
+_SHLEX_WHITESPACE_RE = re.compile(r'[ \t\r\n]+')
+
+# Fixed bwrap arguments shared by every sandboxed invocation
+_SANDBOX_BASE_ARGS = (
+    '--die-with-parent',
+    '--unshare-pid',
+    '--dev-bind', '/dev', 'dev',
+    '--proc', '/proc',
+    '--dir', '/tmp',
+    '--ro-bind', '/bin', '/bin',
+    '--ro-bind', '/etc', '/etc',
+    '--ro-bind', '/usr', '/usr',
+    '--ro-bind', '/opt', '/opt',
+    '--symlink', 'usr/lib', '/lib',
+    '--symlink', 'usr/lib64', '/lib64',
+)
+
+
+def _split_cmdline(cmdline):
+    """
+    Split a command line string the same way ``shlex.split()`` does, skipping
+    the lexer entirely for the common case of plain whitespace separated args.
+    An already split list or tuple of arguments is returned as a new list.
+    """
+    if isinstance(cmdline, (list, tuple)):
+        return list(cmdline)
+    if _SHLEX_SPECIAL_CHARS.isdisjoint(cmdline):
+        return [arg for arg in _SHLEX_WHITESPACE_RE.split(cmdline) if arg]
+    return shlex.split(cmdline)
+
+
+def _link_or_copy(src, dst):
+    """
+    ``shutil.copytree()`` copy function that hard links ``src`` to ``dst``,
+    falling back to a regular copy when a link cannot be made (for example
+    across devices).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 
 class ExecutionMode():
     NONE = 0
@@ -124,8 +169,7 @@ class RunnerConfig(BaseConfig):
             raise ConfigurationError("Runner Base Directory is not defined")
         if self.module and self.playbook:
             raise ConfigurationError("Only one of playbook and module options are allowed")
-        if not os.path.exists(self.artifact_dir):
-            os.makedirs(self.artifact_dir, mode=0o700)
+        os.makedirs(self.artifact_dir, mode=0o700, exist_ok=True)
 
         # Since the `sandboxed` property references attributes that may come from `env/settings`,
         # we must call prepare_env() before we can reference it.
@@ -133,9 +177,11 @@ class RunnerConfig(BaseConfig):
 
         if self.sandboxed and self.directory_isolation_path is not None:
             self.directory_isolation_path = tempfile.mkdtemp(prefix='runner_di_', dir=self.directory_isolation_path)
-            if os.path.exists(self.project_dir):
+            # a read-only isolation bind mounts the project in place of the copy (see wrap_args_for_sandbox)
+            if not self.directory_isolation_readonly and os.path.exists(self.project_dir):
                 output.debug(f"Copying directory tree from {self.project_dir} to {self.directory_isolation_path} for working directory isolation")
-                shutil.copytree(self.project_dir, self.directory_isolation_path, dirs_exist_ok=True, symlinks=True)
+                copy_kwargs = {'copy_function': _link_or_copy} if self.directory_isolation_hardlink else {}
+                shutil.copytree(self.project_dir, self.directory_isolation_path, dirs_exist_ok=True, symlinks=True, **copy_kwargs)
 
         self.prepare_inventory()
         self.prepare_command()
@@ -188,6 +234,8 @@ class RunnerConfig(BaseConfig):
         self.process_isolation_ro_paths = self.settings.get('process_isolation_ro_paths', self.process_isolation_ro_paths)
         self.directory_isolation_path = self.settings.get('directory_isolation_base_path', self.directory_isolation_path)
         self.directory_isolation_cleanup = bool(self.settings.get('directory_isolation_cleanup', True))
+        self.directory_isolation_hardlink = bool(self.settings.get('directory_isolation_hardlink', False))
+        self.directory_isolation_readonly = bool(self.settings.get('directory_isolation_readonly', False))
 
         if 'AD_HOC_COMMAND_ID' in self.env or not os.path.exists(self.project_dir):
             self.cwd = self.private_data_dir
@@ -200,9 +248,9 @@ class RunnerConfig(BaseConfig):
         if 'fact_cache' in self.settings:
             if 'fact_cache_type' in self.settings:
                 if self.settings['fact_cache_type'] == 'jsonfile':
-                    self.fact_cache = os.path.join(self.artifact_dir, self.settings['fact_cache'])
+                    self.fact_cache = self._fact_cache_path(self.settings['fact_cache'])
             else:
-                self.fact_cache = os.path.join(self.artifact_dir, self.settings['fact_cache'])
+                self.fact_cache = self._fact_cache_path(self.settings['fact_cache'])
 
         if self.roles_path:
             if isinstance(self.roles_path, list):
@@ -216,7 +264,7 @@ class RunnerConfig(BaseConfig):
     def prepare_command(self):
         try:
             cmdline_args = self.loader.load_file('args', str, encoding=None)
-            self.command = shlex.split(cmdline_args)
+            self.command = _split_cmdline(cmdline_args)
             self.execution_mode = ExecutionMode.RAW
         except ConfigurationError:
             self.command = self.generate_ansible_command()
@@ -245,7 +293,7 @@ class RunnerConfig(BaseConfig):
             else:
                 cmdline_args = self.loader.load_file('env/cmdline', str, encoding=None)
 
-            args = shlex.split(cmdline_args)
+            args = _split_cmdline(cmdline_args)
             exec_list.extend(args)
         except ConfigurationError:
             pass
@@ -273,16 +321,7 @@ class RunnerConfig(BaseConfig):
 
         if self.extra_vars:
             if isinstance(self.extra_vars, dict) and self.extra_vars:
-                extra_vars_list = []
-                for k in self.extra_vars:
-                    extra_vars_list.append(f"\"{k}\":{json.dumps(self.extra_vars[k])}")
-
-                exec_list.extend(
-                    [
-                        '-e',
-                        f'{{{",".join(extra_vars_list)}}}'
-                    ]
-                )
+                exec_list.extend(['-e', json.dumps(self.extra_vars, separators=(',', ':'))])
             elif self.loader.isfile(self.extra_vars):
                 exec_list.extend(['-e', f'@{self.loader.abspath(self.extra_vars)}'])
 
@@ -319,8 +358,8 @@ class RunnerConfig(BaseConfig):
         '''
         Create a temporary directory for process isolation to use.
         '''
+        # mkdtemp() creates the directory readable, writable and searchable only by its owner
         path = tempfile.mkdtemp(prefix='ansible_runner_pi_', dir=self.process_isolation_path)
-        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR)
 
         register_for_cleanup(path)
 
@@ -331,42 +370,28 @@ class RunnerConfig(BaseConfig):
         Wrap existing command line with bwrap to restrict access to:
          - self.process_isolation_path (generally, /tmp) (except for own /tmp files)
         '''
-        cwd = os.path.realpath(self.cwd)
         self.process_isolation_path_actual = self.build_process_isolation_temp_dir()
         new_args = [self.process_isolation_executable or 'bwrap']
-
-        new_args.extend([
-            '--die-with-parent',
-            '--unshare-pid',
-            '--dev-bind', '/dev', 'dev',
-            '--proc', '/proc',
-            '--dir', '/tmp',
-            '--ro-bind', '/bin', '/bin',
-            '--ro-bind', '/etc', '/etc',
-            '--ro-bind', '/usr', '/usr',
-            '--ro-bind', '/opt', '/opt',
-            '--symlink', 'usr/lib', '/lib',
-            '--symlink', 'usr/lib64', '/lib64',
-        ])
+        new_args.extend(_SANDBOX_BASE_ARGS)
 
         for path in sorted(set(self.process_isolation_hide_paths or [])):
             if not os.path.exists(path):
                 logger.debug('hide path not found: %s', path)
                 continue
             path = os.path.realpath(path)
+            # mkdtemp() and mkstemp() already create their targets readable and
+            # writable only by the current user (0700 and 0600 respectively)
             if os.path.isdir(path):
                 new_path = tempfile.mkdtemp(dir=self.process_isolation_path_actual)
-                os.chmod(new_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR)
             else:
                 handle, new_path = tempfile.mkstemp(dir=self.process_isolation_path_actual)
                 os.close(handle)
-                os.chmod(new_path, stat.S_IRUSR | stat.S_IWUSR)
             new_args.extend(['--bind', new_path, path])
 
         if self.private_data_dir:
             show_paths = [self.private_data_dir]
         else:
-            show_paths = [cwd]
+            show_paths = [os.path.realpath(self.cwd)]
 
         for path in sorted(set(self.process_isolation_ro_paths or [])):
             if not os.path.exists(path):
@@ -383,6 +408,10 @@ class RunnerConfig(BaseConfig):
             path = os.path.realpath(path)
             new_args.extend(['--bind', path, path])
 
+        if self.directory_isolation_path is not None and self.directory_isolation_readonly and os.path.exists(self.project_dir):
+            # prepare() left the isolation directory empty; show the project there read-only, whatever the execution mode
+            new_args.extend(['--ro-bind', os.path.realpath(self.project_dir), os.path.realpath(self.directory_isolation_path)])
+
         if self.execution_mode == ExecutionMode.ANSIBLE_PLAYBOOK:
             # playbook runs should cwd to the SCM checkout dir
             if self.directory_isolation_path is not None:
@@ -167,7 +167,8 @@ def run(**kwargs):
     :param dict settings: A dictionary containing settings values for the ``ansible-runner`` runtime environment. These will also
                      be read from ``env/settings`` in ``private_data_dir``.
     :param str ssh_key: The ssh private key passed to ``ssh-agent`` as part of the ansible-playbook run.
-    :param str cmdline: Command line options passed to Ansible read from ``env/cmdline`` in ``private_data_dir``
+    :param str or list cmdline: Command line options passed to Ansible read from ``env/cmdline`` in ``private_data_dir``.
+                       A list is taken as already split arguments and is quoted when written to ``env/cmdline``.
     :param bool suppress_env_files: Disable the writing of files into the ``env`` which may store sensitive information
     :param str limit: Matches ansible's ``--limit`` parameter to further constrain the inventory to be used
     :param int forks: Control Ansible parallel concurrency
@@ -201,6 +202,8 @@ def run(**kwargs):
     :param str fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param str fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param bool fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param bool omit_event_data: Omits extra ansible event data from event payload (stdout and event still included)
     :param bool only_failed_event_data: Omits extra ansible event data unless it's a failed event (stdout and event still included)
     :param bool check_job_event_data: Check if job events data is completely generated. If event data is not completely generated and if
@@ -293,6 +296,8 @@ def run_command(executable_cmd, cmdline_args=None, **kwargs):
     :param str fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param str fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param bool fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param str private_data_dir: The directory containing all runner metadata needed to invoke the runner
                              module. Output artifacts will also be stored here for later consumption.
     :param str ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -397,6 +402,8 @@ def get_plugin_docs(plugin_names, plugin_type=None, response_format=None, snippe
     :param fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param private_data_dir: The directory containing all runner metadata needed to invoke the runner
                              module. Output artifacts will also be stored here for later consumption.
     :param ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -425,6 +432,7 @@ def get_plugin_docs(plugin_names, plugin_type=None, response_format=None, snippe
     :type project_dir: str
     :type artifact_dir: str
     :type fact_cache_type: str
+    :type fact_cache_shared: bool
     :type fact_cache: str
     :type process_isolation: bool
     :type process_isolation_executable: str
@@ -515,6 +523,8 @@ def get_plugin_list(list_files=None, response_format=None, plugin_type=None, pla
     :param fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param private_data_dir: The directory containing all runner metadata needed to invoke the runner
                              module. Output artifacts will also be stored here for later consumption.
     :param ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -542,6 +552,7 @@ def get_plugin_list(list_files=None, response_format=None, plugin_type=None, pla
     :type project_dir: str
     :type artifact_dir: str
     :type fact_cache_type: str
+    :type fact_cache_shared: bool
     :type fact_cache: str
     :type process_isolation: bool
     :type process_isolation_executable: str
@@ -636,6 +647,8 @@ def get_inventory(action, inventories, response_format=None, host=None, playbook
     :param fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param private_data_dir: The directory containing all runner metadata needed to invoke the runner
                              module. Output artifacts will also be stored here for later consumption.
     :param ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -666,6 +679,7 @@ def get_inventory(action, inventories, response_format=None, host=None, playbook
     :type project_dir: str
     :type artifact_dir: str
     :type fact_cache_type: str
+    :type fact_cache_shared: bool
     :type fact_cache: str
     :type process_isolation: bool
     :type process_isolation_executable: str
@@ -751,6 +765,8 @@ def get_ansible_config(action, config_file=None, only_changed=None, **kwargs):
     :param fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param private_data_dir: The directory containing all runner metadata needed to invoke the runner
                              module. Output artifacts will also be stored here for later consumption.
     :param ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -775,6 +791,7 @@ def get_ansible_config(action, config_file=None, only_changed=None, **kwargs):
     :type project_dir: str
     :type artifact_dir: str
     :type fact_cache_type: str
+    :type fact_cache_shared: bool
     :type fact_cache: str
     :type process_isolation: bool
     :type process_isolation_executable: str
@@ -856,6 +873,8 @@ def get_role_list(collection=None, playbook_dir=None, **kwargs):
     :param str fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param str fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param bool fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param str private_data_dir: The directory containing all runner metadata needed to invoke the runner
         module. Output artifacts will also be stored here for later consumption.
     :param str ident: The run identifier for this invocation of Runner. Will be used to create and name
@@ -934,6 +953,8 @@ def get_role_argspec(role, collection=None, playbook_dir=None, **kwargs):
     :param str fact_cache: A string that will be used as the name for the subdirectory of the fact cache in artifacts directory.
                        This is only used for 'jsonfile' type fact caches.
     :param str fact_cache_type: A string of the type of fact cache to use.  Defaults to 'jsonfile'.
+    :param bool fact_cache_shared: Keep a 'jsonfile' fact cache in the private data directory instead of the per-run
+                       artifacts directory, so cached facts persist across runs and artifact rotation. Defaults to False.
     :param str private_data_dir: The directory containing all runner metadata needed to invoke the runner
         module. Output artifacts will also be stored here for later consumption.
     :param str ident: The run identifier for this invocation of Runner. Will be used to create and name
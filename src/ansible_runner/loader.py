@@ -21,14 +21,27 @@ from __future__ import annotations
 
 import os
 import json
+import re
 import codecs
 
+from collections.abc import Callable
 from typing import Any, Dict
-from yaml import safe_load, YAMLError
+from yaml import load as yaml_load, YAMLError
+
+try:
+    # libyaml's C scanner/parser is considerably faster than the pure Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
 
 from ansible_runner.exceptions import ConfigurationError
 from ansible_runner.output import debug
 
+# how a JSON document can start, including the NaN/Infinity extensions json.loads()
+# accepts; anything else (e.g. a YAML '---' header) cannot be JSON, so the
+# failing json.loads() attempt is skipped
+_looks_like_json = re.compile(r'\s*(?:[{\["tfnNI0-9]|-[0-9I])').match
+
 
 class ArtifactLoader:
     '''
@@ -71,7 +84,7 @@ class ArtifactLoader:
             otherwise returns None.
        '''
         try:
-            return safe_load(contents)
+            return yaml_load(contents, Loader=SafeLoader)
         except YAMLError:
             return None
 
@@ -87,14 +100,16 @@ class ArtifactLoader:
 
         :raises: ConfigurationError if the file cannot be loaded.
         '''
+        # open() directly rather than probing with os.path.exists() first; a
+        # missing file is the common case for the optional env/ files
         try:
-            if not os.path.exists(path):
-                raise ConfigurationError(f"specified path does not exist {path}")
             with codecs.open(path, encoding='utf-8') as f:
                 data = f.read()
 
             return data
 
+        except FileNotFoundError as exc:
+            raise ConfigurationError(f"specified path does not exist {path}") from exc
         except (IOError, OSError) as exc:
             raise ConfigurationError(f"error trying to load file contents: {exc}") from exc
 
@@ -159,7 +174,13 @@ class ArtifactLoader:
             raise ConfigurationError('unable to encode file contents') from exc
 
         if objtype is not str:
-            for deserializer in (self._load_json, self._load_yaml):
+            deserializers: tuple[Callable[[str], dict | None], ...]
+            if _looks_like_json(contents):
+                deserializers = (self._load_json, self._load_yaml)
+            else:
+                deserializers = (self._load_yaml,)
+
+            for deserializer in deserializers:
                 parsed_data = deserializer(contents)
                 if parsed_data:
                     break
@@ -2,7 +2,6 @@ import os
 import stat
 import time
 import json
-import errno
 import signal
 from subprocess import Popen, PIPE, CalledProcessError, TimeoutExpired, run as run_subprocess
 import shutil
@@ -123,17 +122,13 @@ class Runner:
         self.status_callback('starting')
         command_filename = os.path.join(self.config.artifact_dir, 'command')
 
-        try:
-            os.makedirs(self.config.artifact_dir, mode=0o700)
-        except OSError as exc:
-            if exc.errno == errno.EEXIST and os.path.isdir(self.config.artifact_dir):
-                pass
-            else:
-                raise
+        os.makedirs(self.config.artifact_dir, mode=0o700, exist_ok=True)
 
         job_events_path = os.path.join(self.config.artifact_dir, 'job_events')
-        if not os.path.exists(job_events_path):
+        try:
             os.mkdir(job_events_path, 0o700)
+        except FileExistsError:
+            pass
 
         command = self.config.command
         with codecs.open(command_filename, 'w', encoding='utf-8') as f:
@@ -571,7 +566,6 @@ class Runner:
         if self.config.fact_cache_type != 'jsonfile':
             raise Exception('Unsupported fact cache type.  Only "jsonfile" is supported for reading and writing facts from ansible-runner')
         fact_cache = os.path.join(self.config.fact_cache, host)
-        if not os.path.exists(os.path.dirname(fact_cache)):
-            os.makedirs(os.path.dirname(fact_cache), mode=0o700)
+        os.makedirs(os.path.dirname(fact_cache), mode=0o700, exist_ok=True)
         with open(fact_cache, 'w') as f:
             return f.write(json.dumps(data))
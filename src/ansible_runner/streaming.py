@@ -1,6 +1,5 @@
 from __future__ import annotations  # allow newer type syntax until 3.10 is our minimum
 
-import codecs
 import json
 import os
 import stat
@@ -53,16 +52,14 @@ class Transmitter:
 
     def run(self):
         self._output.write(
-            json.dumps({'kwargs': self.kwargs}, cls=UUIDEncoder).encode('utf-8')
+            json.dumps({'kwargs': self.kwargs}, cls=UUIDEncoder).encode('utf-8') + b'\n'
         )
-        self._output.write(b'\n')
         self._output.flush()
 
         if not self.only_transmit_kwargs:
             stream_dir(self.private_data_dir, self._output)
 
-        self._output.write(json.dumps({'eof': True}).encode('utf-8'))
-        self._output.write(b'\n')
+        self._output.write(json.dumps({'eof': True}).encode('utf-8') + b'\n')
         self._output.flush()
 
         return self.status, self.rc
@@ -225,14 +222,12 @@ class Worker:
     def status_handler(self, status_data, runner_config):
         # pylint: disable=W0613
         self.status = status_data['status']
-        self._output.write(json.dumps(status_data).encode('utf-8'))
-        self._output.write(b'\n')
+        self._output.write(json.dumps(status_data).encode('utf-8') + b'\n')
         self._output.flush()
 
     @_synchronize_output_reset_keepalive  # type: ignore
     def event_handler(self, event_data):
-        self._output.write(json.dumps(event_data).encode('utf-8'))
-        self._output.write(b'\n')
+        self._output.write(json.dumps(event_data).encode('utf-8') + b'\n')
         self._output.flush()
 
     @_synchronize_output_reset_keepalive  # type: ignore
@@ -244,8 +239,7 @@ class Worker:
     def finished_callback(self, runner_obj):
         # pylint: disable=W0613
         self._end_keepalive()  # ensure that we can't splat a keepalive event after the eof event
-        self._output.write(json.dumps({'eof': True}).encode('utf-8'))
-        self._output.write(b'\n')
+        self._output.write(json.dumps({'eof': True}).encode('utf-8') + b'\n')
         self._output.flush()
 
 
@@ -280,6 +274,7 @@ class Processor:
                 self.artifact_dir = os.path.join(project_artifacts, str(ident))
             else:
                 self.artifact_dir = project_artifacts
+        self._job_events_prefix = os.path.join(self.artifact_dir, 'job_events', '')
 
         self.status_handler = status_handler
         self.event_handler = event_handler
@@ -288,6 +283,10 @@ class Processor:
         self.cancel_callback = cancel_callback  # FIXME: unused
         self.finished_callback = finished_callback
 
+        # resolve the plugin handlers once instead of on every event
+        self._plugin_status_handlers = [plugin.status_handler for plugin in ansible_runner.plugins.values()]
+        self._plugin_event_handlers = [plugin.event_handler for plugin in ansible_runner.plugins.values()]
+
         self.status = "unstarted"
         self.rc = None
 
@@ -298,12 +297,12 @@ class Processor:
             self.config.env = status_data.get('env')
             self.config.cwd = status_data.get('cwd')
 
-        for plugin in ansible_runner.plugins:
-            ansible_runner.plugins[plugin].status_handler(self.config, status_data)
+        for plugin_status_handler in self._plugin_status_handlers:
+            plugin_status_handler(self.config, status_data)
         if self.status_handler is not None:
             self.status_handler(status_data, runner_config=self.config)
 
-    def event_callback(self, event_data):
+    def event_callback(self, event_data, raw_event: bytes | None = None):
         # FIXME: this needs to be more defensive to not blow up on "malformed" events or new values it doesn't recognize
         counter = event_data.get('counter')
         uuid_val = event_data.get('uuid')
@@ -312,23 +311,32 @@ class Processor:
             # FIXME: log a warning about a malformed event?
             return
 
-        full_filename = os.path.join(self.artifact_dir,
-                                     'job_events',
-                                     f'{counter}-{uuid_val}.json')
+        full_filename = f'{self._job_events_prefix}{counter}-{uuid_val}.json'
 
         if not self.quiet and 'stdout' in event_data:
             print(event_data['stdout'])
 
         if self.event_handler is not None:
             should_write = self.event_handler(event_data)
+            # the handler may have modified the event, so it has to be serialized again
+            raw_event = None
         else:
             should_write = True
-        for plugin in ansible_runner.plugins:
-            ansible_runner.plugins[plugin].event_handler(self.config, event_data)
+        for plugin_event_handler in self._plugin_event_handlers:
+            plugin_event_handler(self.config, event_data)
+            raw_event = None
         if should_write:
-            with codecs.open(full_filename, 'w', encoding='utf-8') as write_file:
-                os.chmod(full_filename, stat.S_IRUSR | stat.S_IWUSR)
-                json.dump(event_data, write_file)
+            if raw_event is None:
+                raw_event = json.dumps(event_data).encode('utf-8')
+            # create the file owner read/write only up front rather than chmod'ing it afterwards
+            fd = os.open(full_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+            try:
+                # the event is a single bytes object already, no need for a buffered file object
+                remaining = memoryview(raw_event)
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
 
     def artifacts_callback(self, artifacts_data):
         length = artifacts_data['zipfile']
@@ -339,8 +347,7 @@ class Processor:
 
     def run(self):
         job_events_path = os.path.join(self.artifact_dir, 'job_events')
-        if not os.path.exists(job_events_path):
-            os.makedirs(job_events_path, 0o700, exist_ok=True)
+        os.makedirs(job_events_path, 0o700, exist_ok=True)
 
         while True:
             try:
@@ -365,7 +372,10 @@ class Processor:
                 # just ignore keepalives
                 continue
             else:
-                self.event_callback(data)
+                # nothing has touched the event yet, so the line as received can be written out as-is;
+                # a text-mode _input yields str lines, which are simply serialized again
+                raw_event = line.rstrip(b'\n') if isinstance(line, bytes) else None
+                self.event_callback(data, raw_event)
 
         if self.finished_callback is not None:
             self.finished_callback(self)
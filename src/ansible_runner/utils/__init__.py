@@ -13,6 +13,7 @@ import tempfile
 import subprocess
 import base64
 import threading
+from functools import lru_cache
 from pathlib import Path
 import pwd
 from shlex import quote
@@ -22,8 +23,9 @@ import atexit
 import signal
 
 from codecs import StreamReaderWriter
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from io import StringIO
+from types import MappingProxyType
 from typing import Any, Iterator
 
 from ansible_runner.exceptions import ConfigurationError
@@ -46,12 +48,18 @@ def register_for_cleanup(folder: str) -> None:
     atexit.register(cleanup_folder, folder)
 
 
+# The package location cannot change for the lifetime of the process, so resolve
+# the display callback paths once at import time rather than on every prepare().
+_PLUGIN_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "display_callback"))
+_CALLBACK_DIR = os.path.join(_PLUGIN_DIR, 'callback')
+
+
 def get_plugin_dir() -> str:
-    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "display_callback"))
+    return _PLUGIN_DIR
 
 
 def get_callback_dir() -> str:
-    return os.path.join(get_plugin_dir(), 'callback')
+    return _CALLBACK_DIR
 
 
 def is_dir_owner(directory: str) -> bool:
@@ -135,8 +143,7 @@ def dump_artifact(obj: str,
 
     :return: The full path filename for the artifact that was generated.
     '''
-    if not os.path.exists(path):
-        os.makedirs(path, mode=0o700)
+    os.makedirs(path, mode=0o700, exist_ok=True)
 
     p_sha1 = hashlib.sha1()
     p_sha1.update(obj.encode(encoding='UTF-8'))
@@ -252,7 +259,10 @@ def dump_artifacts(kwargs: dict) -> None:
             obj = kwargs.get(key)
             if obj and not os.path.exists(os.path.join(private_data_dir, 'env', key)):
                 path = os.path.join(private_data_dir, 'env')
-                dump_artifact(str(kwargs[key]), path, key)
+                if key == 'cmdline' and isinstance(obj, (list, tuple)):
+                    # quote each argument so env/cmdline splits back into the same list
+                    obj = args2cmdline(*obj)
+                dump_artifact(str(obj), path, key)
                 kwargs.pop(key)
 
 
@@ -426,8 +436,12 @@ def open_fifo_write(path: str, data: str | bytes) -> None:
         with open(path, 'wb') as fh:
             fh.write(data)
 
+    # daemon so a fifo that is never read (e.g. the job failed before
+    # ssh-add ran) cannot keep the interpreter alive at exit
     threading.Thread(target=worker,
-                     args=(path, data)).start()
+                     args=(path, data),
+                     name='ansible-runner-fifo-writer',
+                     daemon=True).start()
 
 
 def args2cmdline(*args):
@@ -461,25 +475,32 @@ def sanitize_container_name(original_name: str) -> str:
 
 
 def cli_mounts():
-    return [
-        {
-            'ENVS': ['SSH_AUTH_SOCK'],
-            'PATHS': [
-                {
-                    'src': f"{os.environ['HOME']}/.ssh/",
+    return _cli_mounts(os.environ['HOME'])
+
+
+@lru_cache(maxsize=8)
+def _cli_mounts(home: str) -> tuple[Mapping[str, tuple], ...]:
+    # Built once per $HOME value and shared by every caller, so the table is
+    # made of tuples and read-only mappings that cannot be modified in place.
+    return (
+        MappingProxyType({
+            'ENVS': ('SSH_AUTH_SOCK',),
+            'PATHS': (
+                MappingProxyType({
+                    'src': f"{home}/.ssh/",
                     'dest': '/home/runner/.ssh/'
-                },
-                {
-                    'src': f"{os.environ['HOME']}/.ssh/",
+                }),
+                MappingProxyType({
+                    'src': f"{home}/.ssh/",
                     'dest': '/root/.ssh/'
-                },
-                {
+                }),
+                MappingProxyType({
                     'src': '/etc/ssh/ssh_known_hosts',
                     'dest': '/etc/ssh/ssh_known_hosts'
-                }
-            ]
-        },
-    ]
+                }),
+            )
+        }),
+    )
 
 
 def sanitize_json_response(data: str) -> str:
@@ -496,13 +517,26 @@ def sanitize_json_response(data: str) -> str:
     return data
 
 
-def get_executable_path(name: str) -> str:
-    exec_path = shutil.which(name)
+@lru_cache(maxsize=32)
+def _which(name: str, path: str | None) -> str:
+    exec_path = shutil.which(name, path=path)
     if exec_path is None:
+        # lru_cache does not store exceptions, so a binary installed after a failed lookup is still found
         raise ConfigurationError(f"{name} command not found")
     return exec_path
 
 
+def get_executable_path(name: str) -> str:
+    # PATH is part of the cache key so a modified environment is still honored
+    path = os.environ.get('PATH')
+    exec_path = _which(name, path)
+    if not os.access(exec_path, os.X_OK):
+        # the cached binary has been removed or is no longer executable; look it up again
+        _which.cache_clear()
+        exec_path = _which(name, path)
+    return exec_path
+
+
 def signal_handler() -> Callable[[], bool] | None:
     # Only the main thread is allowed to set a new signal handler
     # pylint: disable=W4902
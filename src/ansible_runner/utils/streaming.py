@@ -6,44 +6,82 @@ import tempfile
 import zipfile
 import os
 import json
+import shutil
 import sys
 import stat
 from pathlib import Path
+from typing import Iterator
 
 from .base64io import Base64IO
 
+_STREAM_CHUNK_SIZE = 1024 * 1000  # 1 MB
+
+# The archive is built once and sent straight away, so compression speed
+# matters more than the last few percent of size; level 1 is several times
+# faster than zlib's default of 6. Receivers inflate any level the same way.
+_STREAM_COMPRESSLEVEL = 1
+
+# Files that are already compressed gain nothing from DEFLATE, only CPU time,
+# so they are stored as-is in the streamed archive
+_STORED_SUFFIXES = frozenset((
+    '.gz', '.tgz', '.bz2', '.xz', '.zst', '.zip', '.whl', '.jar',
+    '.png', '.jpg', '.jpeg', '.gif',
+))
+
+
+def _iter_archive_entries(directory: str, relpath: str = "") -> Iterator[tuple[os.DirEntry, str]]:
+    """
+    Yield ``(DirEntry, archive path)`` pairs for everything below ``directory``,
+    top-down like ``os.walk()``.
+
+    The entry type comes from the directory listing itself, so regular files,
+    directories and symlinks are classified without a ``stat()`` call each.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        # match os.walk(), which silently skips unreadable directories
+        return
+
+    subdirs = []
+    for entry in entries:
+        arcname = os.path.join(relpath, entry.name)
+        yield entry, arcname
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append((entry.path, arcname))
+
+    for path, arcname in subdirs:
+        yield from _iter_archive_entries(path, arcname)
+
 
 def stream_dir(source_directory: str, stream: io.FileIO) -> None:
     with tempfile.NamedTemporaryFile() as tmp:
         with zipfile.ZipFile(
-            tmp.name, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True, strict_timestamps=False
+            tmp.name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=_STREAM_COMPRESSLEVEL,
+            allowZip64=True, strict_timestamps=False
         ) as archive:
             if source_directory:
-                for dirpath, dirs, files in os.walk(source_directory):
-                    relpath = os.path.relpath(dirpath, source_directory)
-                    if relpath == ".":
-                        relpath = ""
-                    for fname in files + dirs:
-                        full_path = os.path.join(dirpath, fname)
-                        # Magic to preserve symlinks
-                        if os.path.islink(full_path):
-                            archive_relative_path = os.path.relpath(dirpath, source_directory)
-                            file_relative_path = os.path.join(archive_relative_path, fname)
-                            zip_info = zipfile.ZipInfo(file_relative_path)
-                            zip_info.create_system = 3
-                            permissions = 0o777
-                            permissions |= 0xA000
-                            zip_info.external_attr = permissions << 16
-                            archive.writestr(zip_info, os.readlink(full_path))
-                        elif stat.S_ISFIFO(os.stat(full_path).st_mode):
-                            # skip any pipes, as python hangs when attempting
-                            # to open them.
-                            # i.e. ssh_key_data that was never cleaned up
-                            continue
-                        else:
-                            archive.write(
-                                os.path.join(dirpath, fname), arcname=os.path.join(relpath, fname)
-                            )
+                for entry, arcname in _iter_archive_entries(source_directory):
+                    # Magic to preserve symlinks
+                    if entry.is_symlink():
+                        zip_info = zipfile.ZipInfo(arcname)
+                        zip_info.create_system = 3
+                        permissions = 0o777
+                        permissions |= 0xA000
+                        zip_info.external_attr = permissions << 16
+                        archive.writestr(zip_info, os.readlink(entry.path))
+                    elif (not entry.is_file(follow_symlinks=False) and not entry.is_dir(follow_symlinks=False)
+                          and stat.S_ISFIFO(entry.stat(follow_symlinks=False).st_mode)):
+                        # skip any pipes, as python hangs when attempting
+                        # to open them.
+                        # i.e. ssh_key_data that was never cleaned up
+                        continue
+                    else:
+                        compress_type = None  # the archive default
+                        if os.path.splitext(entry.name)[1].lower() in _STORED_SUFFIXES:
+                            compress_type = zipfile.ZIP_STORED
+                        archive.write(entry.path, arcname=arcname, compress_type=compress_type)
             archive.close()
 
         zip_size = Path(tmp.name).stat().st_size
@@ -56,8 +94,9 @@ def stream_dir(source_directory: str, stream: io.FileIO) -> None:
             target.write(json.dumps({"zipfile": zip_size}).encode("utf-8") + b"\n")
             target.flush()
             with Base64IO(target) as encoded_target:
-                for line in source:
-                    encoded_target.write(line)
+                # copy in fixed size chunks; iterating the binary archive by "lines"
+                # yields many tiny, arbitrarily sized writes to encode
+                shutil.copyfileobj(source, encoded_target, _STREAM_CHUNK_SIZE)
 
 
 def unstream_dir(stream: io.FileIO, length: int, target_directory: str) -> None:
@@ -66,7 +105,7 @@ def unstream_dir(stream: io.FileIO, length: int, target_directory: str) -> None:
         with open(tmp.name, "wb") as target:
             with Base64IO(stream) as source:
                 remaining = length
-                chunk_size = 1024 * 1000  # 1 MB
+                chunk_size = _STREAM_CHUNK_SIZE
                 while remaining != 0:
                     chunk_size = min(chunk_size, remaining)
 
@@ -67,6 +67,13 @@ def test_base_config_project_dir(tmp_path):
     assert rc.project_dir == tmp_path.joinpath('project').as_posix()
 
 
+def test_base_config_fact_cache_shared(tmp_path):
+    rc = BaseConfig(private_data_dir=tmp_path.as_posix(), ident='test')
+    assert rc.fact_cache == tmp_path.joinpath('artifacts', 'test', 'fact_cache').as_posix()
+    rc = BaseConfig(private_data_dir=tmp_path.as_posix(), ident='test', fact_cache_shared=True)
+    assert rc.fact_cache == tmp_path.joinpath('fact_cache').as_posix()
+
+
 def test_prepare_environment_vars_only_strings_from_file(mocker):
     rc = BaseConfig(envvars={'D': 'D'})
 
@@ -282,6 +289,49 @@ def test_container_volume_mounting_with_Z(tmp_path, mocker):
         raise Exception(f'Could not find expected mount, args: {new_args}')
 
 
+@pytest.mark.parametrize('cmdline_args, expected', (
+    (['main.yml'], 'main.yml'),
+    (['-i', 'inventory', 'main.yml'], 'main.yml'),
+    (['main.yml', '-i', 'inventory', '--limit', 'all'], 'main.yml'),
+    (['--inventory', 'inventory', '--check', '--limit', 'all', 'main.yml'], 'main.yml'),
+    (['-i', 'inv1', '--inventory-file', 'inv2', '-v', 'main.yml'], ''),
+    (['-i', 'inventory'], ''),
+    (['main.yml', '-i'], None),
+))
+def test_get_playbook_path(cmdline_args, expected, tmp_path):
+    # pylint: disable=W0212
+    rc = BaseConfig(private_data_dir=tmp_path.as_posix())
+    assert rc._get_playbook_path(cmdline_args) == expected
+
+
+def test_handle_ansible_cmd_options_bind_mounts(tmp_path, mocker):
+    # pylint: disable=W0212
+    rc = BaseConfig(private_data_dir=tmp_path.as_posix())
+    update_mounts = mocker.patch.object(rc, '_update_volume_mount_paths')
+
+    rc._handle_ansible_cmd_options_bind_mounts([], [
+        '-i', '/inv/hosts', '-i', 'localhost,', '--vault-password-file', '/vault/pass',
+        '--check', '--private-key', '/keys/id_rsa', '--key-file',
+    ])
+
+    assert [c.args[1] for c in update_mounts.call_args_list] == ['/inv/hosts', '/vault/pass', '/keys/id_rsa']
+
+
+def test_handle_automounts_strips_home_prefix(tmp_path, mocker):
+    # pylint: disable=W0212
+    home = tmp_path / 'home'
+    home.mkdir()
+    sock = home / 'eho.sock'
+    sock.touch()
+    mocker.patch.dict('os.environ', {'HOME': str(home), 'SSH_AUTH_SOCK': str(sock)}, clear=True)
+
+    rc = BaseConfig(private_data_dir=tmp_path.as_posix())
+    new_args = []
+    rc._handle_automounts(new_args)
+
+    assert new_args[-2:] == ['-e', 'SSH_AUTH_SOCK=/home/runner/eho.sock']
+
+
 @pytest.mark.parametrize('runtime', ('docker', 'podman'))
 def test_containerization_settings(tmp_path, runtime, mocker):
     mocker.patch.dict('os.environ', {'HOME': str(tmp_path)}, clear=True)
@@ -367,3 +417,17 @@ def test_containerization_unsafe_write_setting(tmp_path, runtime, mocker):
     }
 
     assert rc.env.get('ANSIBLE_UNSAFE_WRITES') == expected[runtime]
+
+
+def test_container_volume_mount_without_dest(tmp_path, mocker):
+    mock_containerized = mocker.patch('ansible_runner.config._base.BaseConfig.containerized', new_callable=mocker.PropertyMock)
+    mock_containerized.return_value = True
+
+    rc = BaseConfig(private_data_dir=tmp_path)
+    rc.process_isolation_executable = 'podman'
+    rc.container_image = 'my_container'
+    rc.runner_mode = 'subprocess'
+    rc.container_volume_mounts = ['/host1']
+
+    with pytest.raises(ConfigurationError, match="Invalid container volume mount '/host1'"):
+        rc.wrap_args_for_containerization(['ansible-playbook'], BaseExecutionMode.NONE, [])
@@ -93,6 +93,14 @@ def test_check_not_safe_to_mount_file(not_safe, mocker):
         )
 
 
+@pytest.mark.parametrize("not_safe", ("/home/./", "/usr//", "/home/../"))
+def test_check_not_safe_to_mount_unnormalized(not_safe):
+    """Ensure unsafe directories are detected regardless of path spelling"""
+    bc = BaseConfig()
+    with pytest.raises(ConfigurationError):
+        bc._ensure_path_safe_to_mount(not_safe)
+
+
 @pytest.mark.parametrize("path", dir_variations, ids=id_for_src)
 def test_duplicate_detection_dst(path, mocker):
     """Ensure no duplicate volume mount entries are created"""
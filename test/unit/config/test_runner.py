@@ -3,13 +3,15 @@
 from functools import partial
 import os
 import re
+import stat
+import shutil
 
 from test.utils.common import RSAKey
 
 from pexpect import TIMEOUT, EOF
 import pytest
 
-from ansible_runner.config.runner import RunnerConfig, ExecutionMode
+from ansible_runner.config.runner import RunnerConfig, ExecutionMode, _link_or_copy
 from ansible_runner.loader import ArtifactLoader
 from ansible_runner.exceptions import ConfigurationError
 
@@ -242,6 +244,88 @@ def test_prepare_env_directory_isolation_from_settings(mocker, project_fixtures)
     copy_tree.assert_called_once_with(rc.project_dir, rc.directory_isolation_path, dirs_exist_ok=True, symlinks=True)
 
 
+def test_prepare_env_directory_isolation_hardlink(mocker, project_fixtures):
+    mocker.patch('os.makedirs', return_value=True)
+    copy_tree = mocker.patch('shutil.copytree')
+    mocker.patch('tempfile.mkdtemp', return_value='/tmp/runner/runner_di_XYZ')
+    mocker.patch('ansible_runner.config.runner.RunnerConfig.build_process_isolation_temp_dir')
+
+    private_data_dir = project_fixtures / 'directory_isolation'
+    with (private_data_dir / 'env' / 'settings').open('a') as settings:
+        settings.write('directory_isolation_hardlink: True\n')
+    rc = RunnerConfig(private_data_dir=str(private_data_dir), playbook='main.yaml')
+    rc.prepare()
+
+    assert rc.directory_isolation_hardlink is True
+    copy_tree.assert_called_once_with(rc.project_dir, rc.directory_isolation_path, dirs_exist_ok=True, symlinks=True,
+                                      copy_function=_link_or_copy)
+
+
+def test_prepare_env_directory_isolation_readonly(mocker, project_fixtures):
+    mocker.patch('os.makedirs', return_value=True)
+    copy_tree = mocker.patch('shutil.copytree')
+    mocker.patch('tempfile.mkdtemp', return_value='/tmp/runner/runner_di_XYZ')
+    mocker.patch('ansible_runner.config.runner.RunnerConfig.build_process_isolation_temp_dir')
+
+    private_data_dir = project_fixtures / 'directory_isolation'
+    with (private_data_dir / 'env' / 'settings').open('a') as settings:
+        settings.write('directory_isolation_readonly: True\n')
+    rc = RunnerConfig(private_data_dir=str(private_data_dir), playbook='main.yaml')
+    rc.prepare()
+
+    copy_tree.assert_not_called()
+    isolation_path = os.path.realpath('/tmp/runner/runner_di_XYZ')
+    index = rc.command.index('--chdir')
+    assert rc.command[index - 3:index + 2] == ['--ro-bind', os.path.realpath(rc.project_dir), isolation_path, '--chdir', isolation_path]
+
+
+def test_prepare_env_directory_isolation_readonly_raw_mode(mocker, project_fixtures):
+    mocker.patch('os.makedirs', return_value=True)
+    copy_tree = mocker.patch('shutil.copytree')
+    mocker.patch('tempfile.mkdtemp', return_value='/tmp/runner/runner_di_XYZ')
+    mocker.patch('ansible_runner.config.runner.RunnerConfig.build_process_isolation_temp_dir')
+
+    private_data_dir = project_fixtures / 'directory_isolation'
+    with (private_data_dir / 'env' / 'settings').open('a') as settings:
+        settings.write('directory_isolation_readonly: True\n')
+    rc = RunnerConfig(private_data_dir=str(private_data_dir), binary='/bin/true', playbook='main.yaml')
+    rc.prepare()
+
+    assert rc.execution_mode == ExecutionMode.RAW
+    copy_tree.assert_not_called()
+    index = rc.command.index(os.path.realpath(rc.project_dir))
+    assert rc.command[index - 1:index + 2] == ['--ro-bind', os.path.realpath(rc.project_dir), os.path.realpath('/tmp/runner/runner_di_XYZ')]
+
+
+def test_prepare_env_directory_isolation_readonly_without_project(mocker, project_fixtures):
+    mocker.patch('os.makedirs', return_value=True)
+    mocker.patch('tempfile.mkdtemp', return_value='/tmp/runner/runner_di_XYZ')
+    mocker.patch('ansible_runner.config.runner.RunnerConfig.build_process_isolation_temp_dir')
+
+    private_data_dir = project_fixtures / 'directory_isolation'
+    shutil.rmtree(private_data_dir / 'project')
+    with (private_data_dir / 'env' / 'settings').open('a') as settings:
+        settings.write('directory_isolation_readonly: True\n')
+    rc = RunnerConfig(private_data_dir=str(private_data_dir), playbook='main.yaml')
+    rc.prepare()
+
+    assert rc.cwd == str(private_data_dir)
+    assert os.path.realpath(rc.project_dir) not in rc.command
+
+
+def test_link_or_copy(tmp_path, mocker):
+    src = tmp_path / 'src'
+    src.write_text('data')
+
+    _link_or_copy(str(src), str(tmp_path / 'linked'))
+    assert (tmp_path / 'linked').stat().st_ino == src.stat().st_ino
+
+    mocker.patch('os.link', side_effect=OSError)
+    _link_or_copy(str(src), str(tmp_path / 'copied'))
+    assert (tmp_path / 'copied').stat().st_ino != src.stat().st_ino
+    assert (tmp_path / 'copied').read_text() == 'data'
+
+
 def test_prepare_inventory(mocker):
     mocker.patch('os.makedirs', return_value=True)
     path_exists = mocker.patch('os.path.exists', return_value=True)
@@ -268,6 +352,7 @@ def test_prepare_inventory(mocker):
     'extra_vars, expected',
     (
         ({'test': 'key'}, ['ansible-playbook', '-i', '/inventory', '-e', '@/env/extravars', '-e', '{"test":"key"}', 'main.yaml']),
+        ({'te"st': 'key'}, ['ansible-playbook', '-i', '/inventory', '-e', '@/env/extravars', '-e', '{"te\\"st":"key"}', 'main.yaml']),
         ('/tmp/extravars.yml', ['ansible-playbook', '-i', '/inventory', '-e', '@/env/extravars', '-e', '@/tmp/extravars.yml', 'main.yaml']),
         (None, ['ansible-playbook', '-i', '/inventory', '-e', '@/env/extravars', 'main.yaml']),
     )
@@ -378,6 +463,9 @@ def test_generate_ansible_command_with_dict_extravars(mocker):
 @pytest.mark.parametrize('cmdline,tokens', [
     ('--tags foo --skip-tags', ['--tags', 'foo', '--skip-tags']),
     ('--limit "䉪ቒ칸ⱷ?噂폄蔆㪗輥"', ['--limit', '䉪ቒ칸ⱷ?噂폄蔆㪗輥']),
+    ('  --forks 5\t--diff\n', ['--forks', '5', '--diff']),
+    ("-e 'foo=bar baz' --check", ['-e', 'foo=bar baz', '--check']),
+    ('--limit host\\ one', ['--limit', 'host one']),
 ])
 def test_generate_ansible_command_with_cmdline_args(cmdline, tokens, mocker):
     mocker.patch('os.makedirs', return_value=True)
@@ -395,6 +483,18 @@ def test_generate_ansible_command_with_cmdline_args(cmdline, tokens, mocker):
     assert cmd == ['ansible-playbook'] + tokens + ['-i', '/inventory', 'main.yaml']
 
 
+def test_generate_ansible_command_with_cmdline_args_list(mocker):
+    mocker.patch('os.makedirs', return_value=True)
+    rc = RunnerConfig(private_data_dir='/', playbook='main.yaml', cmdline=['-e', 'foo=bar baz', '--check'])
+    mocker.patch('os.path.exists', return_value=True)
+
+    rc.prepare_inventory()
+    rc.extra_vars = {}
+
+    cmd = rc.generate_ansible_command()
+    assert cmd == ['ansible-playbook', '-e', 'foo=bar baz', '--check', '-i', '/inventory', 'main.yaml']
+
+
 def test_prepare_command_defaults(mocker):
     mocker.patch('os.makedirs', return_value=True)
 
@@ -521,6 +621,18 @@ def test_wrap_args_with_ssh_agent_silent(mocker):
     ]
 
 
+def test_build_process_isolation_temp_dir(mocker, tmp_path):
+    mocker.patch('ansible_runner.config.runner.register_for_cleanup')
+    rc = RunnerConfig(private_data_dir=str(tmp_path))
+    rc.process_isolation_path = str(tmp_path)
+
+    path = rc.build_process_isolation_temp_dir()
+
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.basename(path).startswith('ansible_runner_pi_')
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+
+
 def test_bwrap_process_isolation_defaults(mocker):
     mocker.patch('os.makedirs', return_value=True)
 
@@ -650,6 +762,7 @@ def test_process_isolation_settings(mocker, tmp_path):
     # hide /home
     assert rc.command[index] == '--bind'
     assert 'ansible_runner_pi' in rc.command[index + 1]
+    assert stat.S_IMODE(os.stat(rc.command[index + 1]).st_mode) == 0o600
     assert rc.command[index + 2] == os.path.realpath('/home')  # needed for Mac
 
     # hide /var
@@ -22,3 +22,15 @@ def test_set_cancel_callback(mocker):
         init_runner(ignore_logging=True, cancel_callback=custom_cancel_callback)
 
     assert mock_runner.call_args.kwargs['cancel_callback'] is custom_cancel_callback
+
+
+def test_init_runner_cmdline_list(tmp_path):
+    project_dir = tmp_path / 'project'
+    project_dir.mkdir()
+    (project_dir / 'main.yml').write_text('- hosts: all\n')
+
+    r = init_runner(private_data_dir=str(tmp_path), playbook='main.yml',
+                    cmdline=['-e', 'foo=bar baz', '--tags', 'a'], ignore_logging=True)
+
+    assert (tmp_path / 'env' / 'cmdline').read_text() == "-e 'foo=bar baz' --tags a"
+    assert r.config.command[-5:-1] == ['-e', 'foo=bar baz', '--tags', 'a']
@@ -93,6 +93,34 @@ def test_load_file_json(loader, mocker, tmp_path):
     assert res['test'] == 'string'
 
 
+def test_load_file_yaml_skips_json(loader, mocker, tmp_path):
+    mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_get_contents', return_value='---\ntest: string')
+    mock_load_json = mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_load_json')
+
+    res = loader.load_file(tmp_path.joinpath('test').as_posix())
+
+    assert not mock_load_json.called
+    assert res['test'] == 'string'
+
+
+def test_load_file_json_document(loader, mocker, tmp_path):
+    mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_get_contents', return_value='  {"test": "string"}')
+    mock_load_yaml = mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_load_yaml')
+
+    res = loader.load_file(tmp_path.joinpath('test').as_posix())
+
+    assert not mock_load_yaml.called
+    assert res['test'] == 'string'
+
+
+def test_load_file_json_constant(loader, mocker, tmp_path):
+    mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_get_contents', return_value='-Infinity')
+
+    res = loader.load_file(tmp_path.joinpath('test').as_posix())
+
+    assert res == float('-inf')
+
+
 def test_load_file_type_check(loader, mocker, tmp_path):
     mock_get_contents = mocker.patch.object(ansible_runner.loader.ArtifactLoader, '_get_contents')
     mock_get_contents.return_value = '---\ntest: string'
@@ -147,6 +147,33 @@ def test_event_callback_interface_calls_event_handler_for_verbose_event(rc, mock
     })
 
 
+def test_shared_fact_cache_survives_artifact_rotation(tmp_path):
+    for ident in ('first', 'second'):
+        rc = RunnerConfig(str(tmp_path), ident=ident, rotate_artifacts=1, fact_cache_shared=True)
+        rc.suppress_ansible_output = True
+        rc.expect_passwords = {
+            pexpect.TIMEOUT: None,
+            pexpect.EOF: None
+        }
+        rc.cwd = str(tmp_path)
+        rc.env = {}
+        rc.job_timeout = .5
+        rc.idle_timeout = 0
+        rc.pexpect_timeout = .1
+        rc.pexpect_use_poll = True
+        rc.command = ['true']
+
+        runner = Runner(config=rc)
+        if ident == 'first':
+            runner.set_fact_cache('localhost', {'foo': 'bar'})
+        status, exitcode = runner.run()
+        assert status == 'successful'
+        assert exitcode == 0
+
+    assert os.listdir(tmp_path / 'artifacts') == ['second']
+    assert runner.get_fact_cache('localhost') == {'foo': 'bar'}
+
+
 def test_status_callback_interface(rc, mocker):
     runner = Runner(config=rc)
     assert runner.status == 'unstarted'
@@ -1,5 +1,9 @@
+import io
+import json
 import os
+import stat
 
+import ansible_runner
 from ansible_runner.streaming import Processor
 
 
@@ -14,3 +18,67 @@ class TestProcessor:
         assert p.artifact_dir == os.path.join(kwargs['private_data_dir'],
                                               'artifacts',
                                               str(kwargs['ident']))
+
+    def test_event_callback_writes_private_event_file(self, tmp_path):
+        p = Processor(private_data_dir=str(tmp_path), quiet=True)
+        os.makedirs(os.path.join(p.artifact_dir, 'job_events'))
+
+        event = {'counter': 1, 'uuid': 'abc', 'stdout': 'ok: [localhost]'}
+        p.event_callback(event)
+
+        event_file = os.path.join(p.artifact_dir, 'job_events', '1-abc.json')
+        with open(event_file) as f:
+            assert json.load(f) == event
+        assert stat.S_IMODE(os.stat(event_file).st_mode) == 0o600
+
+    def test_event_callback_writes_raw_event(self, tmp_path, mocker):
+        mocker.patch.dict(ansible_runner.plugins, clear=True)
+        p = Processor(private_data_dir=str(tmp_path), quiet=True)
+        os.makedirs(os.path.join(p.artifact_dir, 'job_events'))
+
+        raw = b'{"counter": 1, "uuid": "abc"}'
+        p.event_callback(json.loads(raw), raw)
+
+        with open(os.path.join(p.artifact_dir, 'job_events', '1-abc.json'), 'rb') as f:
+            assert f.read() == raw
+
+    def test_event_callback_reserializes_handled_event(self, tmp_path, mocker):
+        mocker.patch.dict(ansible_runner.plugins, clear=True)
+
+        def event_handler(event_data):
+            event_data['job_id'] = 42
+            return True
+
+        p = Processor(private_data_dir=str(tmp_path), quiet=True, event_handler=event_handler)
+        os.makedirs(os.path.join(p.artifact_dir, 'job_events'))
+
+        raw = b'{"counter": 1, "uuid": "abc"}'
+        p.event_callback(json.loads(raw), raw)
+
+        with open(os.path.join(p.artifact_dir, 'job_events', '1-abc.json')) as f:
+            assert json.load(f) == {'counter': 1, 'uuid': 'abc', 'job_id': 42}
+
+
+def test_processor_calls_plugin_handlers(tmp_path, mocker):
+    plugin = mocker.Mock()
+    mocker.patch.dict(ansible_runner.plugins, {'test_plugin': plugin}, clear=True)
+    p = Processor(private_data_dir=str(tmp_path), quiet=True)
+    os.makedirs(os.path.join(p.artifact_dir, 'job_events'))
+
+    status = {'status': 'running'}
+    p.status_callback(status)
+    plugin.status_handler.assert_called_once_with(p.config, status)
+
+    event = {'counter': 1, 'uuid': 'abc'}
+    p.event_callback(event, b'{"counter": 1, "uuid": "abc"}')
+    plugin.event_handler.assert_called_once_with(p.config, event)
+
+
+def test_processor_run_text_input(tmp_path, mocker):
+    mocker.patch.dict(ansible_runner.plugins, clear=True)
+    text_input = io.StringIO('{"counter": 1, "uuid": "abc"}\n{"eof": true}\n')
+    p = Processor(_input=text_input, private_data_dir=str(tmp_path), quiet=True)
+    p.run()
+
+    with open(os.path.join(p.artifact_dir, 'job_events', '1-abc.json')) as f:
+        assert json.load(f) == {'counter': 1, 'uuid': 'abc'}
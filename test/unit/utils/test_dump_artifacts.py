@@ -208,6 +208,7 @@ def test_dont_dump_artifacts_passwords(mocker):
         ('settings', {'foo': 'bar'}, '{"foo": "bar"}'),
         ('ssh_key', '1234567890', '1234567890'),
         ('cmdline', '--tags foo --skip-tags', '--tags foo --skip-tags'),
+        ('cmdline', ['-e', 'foo=bar baz'], "-e 'foo=bar baz'"),
     )
 )
 def test_dump_artifacts_extra_keys(mocker, key, value, value_str):
@@ -25,3 +25,9 @@ def test_fifo_write_string(tmp_path):
         assert results == data
     finally:
         remove(path)
+
+
+def test_fifo_write_thread_is_daemon(tmp_path, mocker):
+    thread = mocker.patch('ansible_runner.utils.threading.Thread')
+    open_fifo_write(tmp_path / "daemon_test", "data")
+    assert thread.call_args.kwargs['daemon'] is True
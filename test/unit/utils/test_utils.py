@@ -7,6 +7,7 @@ import os
 import signal
 import time
 import stat
+import zipfile
 
 from pathlib import Path
 
@@ -17,9 +18,12 @@ from ansible_runner.utils import (
     isinventory,
     check_isolation_executable_installed,
     args2cmdline,
+    cli_mounts,
+    get_executable_path,
     sanitize_container_name,
     signal_handler,
 )
+from ansible_runner.exceptions import ConfigurationError
 from ansible_runner.utils.base64io import _to_bytes, Base64IO
 from ansible_runner.utils.streaming import stream_dir, unstream_dir
 
@@ -123,6 +127,44 @@ def test_transmit_symlink(tmp_path, symlink_dest, check_content):
             assert f.read() == 'hello world'
 
 
+def test_stream_dir_stores_compressed_files(tmp_path):
+    pdd = tmp_path / 'compressed_source'
+    pdd.mkdir()
+    (pdd / 'plain.txt').write_text('hello world' * 100)
+    (pdd / 'collection.tar.gz').write_bytes(b'not really gzip' * 100)
+
+    outgoing_buffer = io.BytesIO()
+    outgoing_buffer.name = 'not_stdout'
+    stream_dir(pdd, outgoing_buffer)
+
+    outgoing_buffer.seek(0)
+    size_data = json.loads(outgoing_buffer.readline().strip())
+    with Base64IO(outgoing_buffer) as source:
+        archive_data = source.read(size_data['zipfile'])
+
+    with zipfile.ZipFile(io.BytesIO(archive_data)) as archive:
+        assert archive.getinfo('plain.txt').compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo('collection.tar.gz').compress_type == zipfile.ZIP_STORED
+
+    dest_dir = tmp_path / 'compressed_dest'
+    dest_dir.mkdir()
+    outgoing_buffer.seek(0)
+    outgoing_buffer.readline()
+    unstream_dir(outgoing_buffer, size_data['zipfile'], dest_dir)
+    assert (dest_dir / 'collection.tar.gz').read_bytes() == b'not really gzip' * 100
+
+
+def test_stream_dir_uses_fast_compression(tmp_path, mocker):
+    zipfile_spy = mocker.spy(zipfile, 'ZipFile')
+    (tmp_path / 'plain.txt').write_text('hello world')
+
+    outgoing_buffer = io.BytesIO()
+    outgoing_buffer.name = 'not_stdout'
+    stream_dir(tmp_path, outgoing_buffer)
+
+    assert zipfile_spy.call_args.kwargs['compresslevel'] == 1
+
+
 @pytest.mark.timeout(timeout=3)
 def test_stream_dir_no_hang_on_pipe(tmp_path):
     # prepare the input private_data_dir directory to zip
@@ -271,6 +313,62 @@ def test_transmit_file_from_before_1980s(tmp_path):
     unstream_dir(outgoing_buffer, size_data['zipfile'], dest_dir)
 
 
+def test_get_executable_path_follows_path_changes(mocker, tmp_path):
+    exe = tmp_path / 'fake-ansible-cmd'
+    exe.write_text('#!/bin/sh\n')
+    exe.chmod(0o755)
+
+    mocker.patch.dict('os.environ', {'PATH': '/nonexistent'})
+    with pytest.raises(ConfigurationError, match='fake-ansible-cmd command not found'):
+        get_executable_path('fake-ansible-cmd')
+
+    mocker.patch.dict('os.environ', {'PATH': str(tmp_path)})
+    assert get_executable_path('fake-ansible-cmd') == str(exe)
+
+
+def test_get_executable_path_finds_newly_installed_binary(mocker, tmp_path):
+    mocker.patch.dict('os.environ', {'PATH': str(tmp_path)})
+    with pytest.raises(ConfigurationError, match='late-ansible-cmd command not found'):
+        get_executable_path('late-ansible-cmd')
+
+    exe = tmp_path / 'late-ansible-cmd'
+    exe.write_text('#!/bin/sh\n')
+    exe.chmod(0o755)
+    assert get_executable_path('late-ansible-cmd') == str(exe)
+
+
+def test_get_executable_path_drops_removed_binary(mocker, tmp_path):
+    first_dir = tmp_path / 'first'
+    second_dir = tmp_path / 'second'
+    for bin_dir in (first_dir, second_dir):
+        bin_dir.mkdir()
+        exe = bin_dir / 'moving-ansible-cmd'
+        exe.write_text('#!/bin/sh\n')
+        exe.chmod(0o755)
+
+    mocker.patch.dict('os.environ', {'PATH': f'{first_dir}:{second_dir}'})
+    assert get_executable_path('moving-ansible-cmd') == str(first_dir / 'moving-ansible-cmd')
+
+    (first_dir / 'moving-ansible-cmd').unlink()
+    assert get_executable_path('moving-ansible-cmd') == str(second_dir / 'moving-ansible-cmd')
+
+    (second_dir / 'moving-ansible-cmd').unlink()
+    with pytest.raises(ConfigurationError, match='moving-ansible-cmd command not found'):
+        get_executable_path('moving-ansible-cmd')
+
+
+def test_cli_mounts_is_read_only(mocker):
+    mocker.patch.dict('os.environ', {'HOME': '/home/someone'})
+    mounts = cli_mounts()
+
+    with pytest.raises(TypeError):
+        mounts[0]['PATHS'][0]['src'] = '/'
+    with pytest.raises(AttributeError):
+        mounts[0]['ENVS'].append('OTHER_SOCK')
+
+    assert cli_mounts()[0]['PATHS'][0]['src'] == '/home/someone/.ssh/'
+
+
 def test_signal_handler(mocker):
     """Test the default handler is set to handle the correct signals"""
 